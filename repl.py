@@ -1,7 +1,23 @@
 import ply.yacc as yacc
 import ply.lex as lex
+import argparse
+import array
+import atexit
+import bisect
+import difflib
+import functools
+import os
 import sys
+import threading
 import math
+import operator
+import re
+import statistics
+import time
+import timeit
+import tracemalloc
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from typing import Union
 
 tokens = [
@@ -30,7 +46,8 @@ reserved = {
     'not': 'NOT',
     'print': 'PRINT',
     'sin': 'SIN',
-    'cos': 'COS'
+    'cos': 'COS',
+    'timeit': 'TIMEIT'
 }
 tokens += reserved.values()
 
@@ -50,6 +67,7 @@ t_NOT = 'not'
 t_PRINT = 'print'
 t_SIN = 'sin'
 t_COS = 'cos'
+t_TIMEIT = 'timeit'
 
 
 def t_POW(t):
@@ -104,6 +122,7 @@ def t_newline(t):
 
 
 def t_error(t):
+    output.flush()
     print("Illegal character '%s'" % t.value[0])
     t.lexer.skip(1)
 
@@ -116,7 +135,7 @@ lexer = lex.lex()
 precedence = (
     ('left', 'IF', 'ELSE', 'THEN', 'WHILE'),
     ('left', ';'),
-    ('right', 'PRINT'),
+    ('right', 'PRINT', 'TIMEIT'),
     ('left', 'EQ', 'NEQ', '>', '<'),
     ('left', 'NOT'),
     ('left', '='),
@@ -168,6 +187,107 @@ class Scope:
         return self.values[name]
 
 
+class Output:
+    """Buffered writer for all the values printed by REPLang, one per line.
+
+    Lines are written to the stream once buffer_size characters are buffered, or when flushed explicitly -
+    before reading input and printing errors, and at exit. With buffer_size 0 each line is written and flushed
+    immediately
+    """
+
+    def __init__(self, stream=sys.stdout, buffer_size=1 << 16):
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self.lines = []
+        self.size = 0
+        # a list collecting the written lines too, while set (used by --watch)
+        self.captured = None
+        atexit.register(self.flush)
+
+    def write(self, val):
+        line = str(val)
+        if self.captured is not None:
+            self.captured.append(line)
+        self.lines.append(line)
+        self.size += len(line) + 1
+        if self.size > self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self.lines:
+            self.lines.append('')
+            self.stream.write('\n'.join(self.lines))
+            self.lines.clear()
+            self.size = 0
+        self.stream.flush()
+
+
+output = Output()
+
+
+class InputReader:
+    """Reads whitespace-separated values and lines from a stream, a large chunk at a time.
+
+    Only the unread part of the current chunk is kept in memory
+    """
+    token_re = re.compile(r'\S+')
+
+    def __init__(self, stream, chunk_size=1 << 20):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.at_end = False
+
+    def fill(self):
+        """Reads the next chunk, appending it to the unread part of the buffer, returns False at the end of stream"""
+        if self.at_end:
+            return False
+        # a terminal is read line by line, so that reading doesn't wait for more than what was typed
+        chunk = self.stream.readline() if self.stream.isatty() else self.stream.read(self.chunk_size)
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        self.at_end = not chunk
+        return bool(chunk)
+
+    def token(self):
+        while True:
+            match = self.token_re.search(self.buffer, self.pos)
+            # a token at the end of the buffer might continue in the next chunk
+            if match and (match.end() < len(self.buffer) or self.at_end):
+                self.pos = match.end()
+                return match.group()
+            if not self.fill() and not match:
+                raise EOFError("No more input to read")
+
+    def line(self):
+        while True:
+            end = self.buffer.find('\n', self.pos)
+            if end >= 0:
+                line = self.buffer[self.pos:end]
+                self.pos = end + 1
+                return line
+            if not self.fill():
+                if self.pos == len(self.buffer):
+                    raise EOFError("No more input to read")
+                # the last line, without a newline at the end
+                line = self.buffer[self.pos:]
+                self.pos = len(self.buffer)
+                return line
+
+    def eof(self):
+        """Checks if there are no more values to read, whitespace left at the end doesn't count"""
+        while True:
+            if self.token_re.search(self.buffer, self.pos):
+                return False
+            self.pos = len(self.buffer)
+            if not self.fill():
+                return True
+
+
+# readers of the named files, None is the standard input (or --input)
+input_readers = {None: InputReader(sys.stdin)}
+
 # storage for variables and functions
 global_scope = Scope()
 functions = {}
@@ -175,21 +295,202 @@ function_types = {}
 arguments = {}
 function_scopes = {}
 RUNNING_AS_REPL = True
+# set to a MemoryReport by --mem-report
+memory_report = None
 
 str_to_type = {'int': int, 'float': float, 'str': str, 'bool': bool}
 
 
+class NodeFactory:
+    """Builds the AST nodes, sharing the structurally identical ones (hash-consing).
+
+    A node is keyed by its parts - nodes by identity, since identical ones are shared already, and values by their
+    type too, since e.g. 1, 1.0 and True are equal in Python. A distinct node gets a sequential id when it's first
+    asked for, which can key caches of per-node data. Nodes are tuples as before, so they must never be
+    modified - sequences, extended in place while parsing, are built without the factory.
+    The factory keeps every node it built, so it's cleared before parsing each input - nodes of different inputs
+    aren't shared, and ids start from 0 again, so they only identify the nodes of the same input.
+
+    The source positions (line and column) of nodes are kept aside, so that evaluation doesn't get slower -
+    a shared node has the positions of all its occurrences
+    """
+
+    def __init__(self):
+        self.nodes = {}
+        self.ids = {}
+        # id of a node -> its position, packed as line << 32 | column, or an array of them if it has several
+        self.positions = {}
+        # id of a copy of a shared node -> the copy, which isn't in nodes but has to stay alive for its position
+        self.copies = {}
+        self.built = 0
+
+    def __call__(self, *parts, at=None):
+        self.built += 1
+        key = self.key_of(parts)
+        node = self.nodes.get(key)
+        if node is None:
+            node = self.nodes[key] = parts
+        if at is not None:
+            packed = at[0] << 32 | at[1]
+            positions = self.positions.get(id(node))
+            if positions is None:
+                self.positions[id(node)] = packed
+            # the same input parsed again, e.g. in the REPL, adds no position
+            elif type(positions) == int:
+                if positions != packed:
+                    self.positions[id(node)] = array.array('Q', [positions, packed])
+            elif positions[-1] != packed:
+                positions.append(packed)
+        return node
+
+    def rebuild(self, old, parts):
+        """Returns a node made of parts at the positions of old, or old itself if its parts are the same"""
+        if len(parts) == len(old) and all(map(same_parts, parts, old)):
+            return old
+        if id(old) in self.copies:
+            return self.copy(self(*parts), self.positions[id(old)])
+        is_new = self.key_of(parts) not in self.nodes
+        new = self(*parts)
+        positions = self.positions.get(id(old))
+        if is_new and positions is not None:
+            self.positions[id(new)] = positions if type(positions) == int else array.array('Q', positions)
+        return new
+
+    def occurrence(self, node):
+        """Returns node at its last position only - a copy of it if it's shared. Statements get their own
+        occurrences, so that an error or a sample in a repeated one is located at the right line"""
+        positions = self.positions.get(id(node)) if type(node) == tuple else None
+        if positions is None or type(positions) == int:
+            return node
+        return self.copy(node, positions[-1])
+
+    def copy(self, node, packed):
+        copy = node[:1] + node[1:]
+        self.copies[id(copy)] = copy
+        self.positions[id(copy)] = packed
+        return copy
+
+    def key_of(self, parts):
+        return tuple([part if type(part) == str else id(part) if type(part) == tuple else self.key(part)
+                      for part in parts])
+
+    def key(self, part):
+        if type(part) == str:
+            return part
+        if type(part) == tuple:
+            return id(part)
+        if type(part) == list:
+            return tuple(self.key(e) for e in part)
+        # 0.0 and -0.0 are equal too
+        return type(part), repr(part) if type(part) == float else part
+
+    def id(self, node):
+        """The id of a node built by the factory, unique until the factory is cleared"""
+        if id(node) not in self.ids:
+            # the node is kept alive by self.nodes or self.copies, so its Python id isn't reused
+            self.ids[id(node)] = len(self.ids)
+        return self.ids[id(node)]
+
+    def position(self, node, near=None, after=None):
+        """The (line, column) of a node, None if unknown. A shared node has several - the one nearest to
+        the position near is picked, or the first one after the position after, or the first one"""
+        positions = self.positions.get(id(node)) if type(node) == tuple else None
+        if positions is None:
+            return None
+        if type(positions) == int:
+            packed = positions
+        elif after is not None:
+            i = bisect.bisect_right(positions, after[0] << 32 | after[1])
+            packed = positions[i] if i < len(positions) else positions[0]
+        elif near is None:
+            packed = positions[0]
+        else:
+            # positions are in the order of parsing, so sorted
+            i = bisect.bisect_left(positions, near[0] << 32 | near[1])
+            packed = min(positions[max(i - 1, 0):i + 1],
+                         key=lambda p: (abs((p >> 32) - near[0]), abs((p & 0xffffffff) - near[1])))
+        return packed >> 32, packed & 0xffffffff
+
+    def clear(self):
+        self.nodes.clear()
+        self.ids.clear()
+        self.positions.clear()
+        self.copies.clear()
+        self.built = 0
+
+    def __str__(self):
+        shared = 1 - len(self.nodes) / self.built if self.built else 0
+        return f"{self.built} nodes built, {len(self.nodes)} distinct ({shared:.1%} shared)"
+
+
+node = NodeFactory()
+
+
+def same_parts(part1, part2):
+    if type(part1) == list and type(part2) == list:
+        return len(part1) == len(part2) and all(e1 is e2 for e1, e2 in zip(part1, part2))
+    return part1 is part2
+
+
+def position(p, n):
+    """Line and column (both from 1) of the n-th symbol of a parsing rule"""
+    lexpos = p.lexpos(n)
+    return p.lineno(n), lexpos - p.lexer.lexdata.rfind('\n', 0, lexpos)
+
+
+def shared_results(transform):
+    """Makes a transformation of the AST (called recursively) compute its result for a shared node once,
+    returning the same result wherever the node occurs - so the result stays shared too.
+
+    The results are kept only during the outermost call, keyed by the identity of the node and of the other arguments
+    """
+    results = None
+
+    @functools.wraps(transform)
+    def transform_shared(expr, *args):
+        nonlocal results
+        if results is None:
+            results = {}
+            try:
+                return transform_shared(expr, *args)
+            finally:
+                results = None
+        if type(expr) != tuple:
+            return transform(expr, *args)
+        key = (id(expr), *map(id, args))
+        if key not in results:
+            # the node and the arguments are kept too, so that their ids aren't reused
+            results[key] = expr, args, transform(expr, *args)
+        return results[key][2]
+
+    return transform_shared
+
+
 def p_statement_expr(p):
     'statement : expression'
-    if type(p[1]) == tuple:
-        print(p[1])
-    val = evaluate(p[1], global_scope)
+    p[0] = [p[1]]
+
+
+def execute(statement):
+    """Executes a top-level statement - a function definition or an expression"""
+    if is_definition(statement):
+        define_function(statement)
+        return None
+    if type(statement) == tuple:
+        output.write(statement)
+    if memory_report is None:
+        val = evaluate(statement, global_scope)
+    else:
+        val = memory_report.evaluate(statement, global_scope)
     if RUNNING_AS_REPL:
-        print(val)
+        output.write(val)
+    return val
 
 
 def p_statement_sequence(p):
     """statement : statement ';' statement"""
+    p[1].extend(p[3])
+    p[0] = p[1]
 
 
 def p_convert(p):
@@ -198,11 +499,18 @@ def p_convert(p):
                 | 2FLOAT
                 | 2BOOL'''
     p[0] = p[1]
+    # the parser doesn't track positions of nonterminals, it's needed by p_expression_convert
+    p.set_lineno(0, p.lineno(1))
+    p.set_lexpos(0, p.lexpos(1))
 
 
 def get_type(expr, scope):
     if not type(expr) == tuple:
         return type(expr)
+    elif expr[0] == 'call' and expr[1] in parallel_reductions:
+        return function_types[expr[2][0][1]]
+    elif expr[0] == 'call' and expr[1] in input_builtins:
+        return input_builtins[expr[1]]
     elif expr[0] == 'call':
         return function_types[expr[1]]
     elif expr[0] == 'name':
@@ -212,11 +520,20 @@ def get_type(expr, scope):
     elif expr[0] in ['assign', 'while']:
         return get_type(expr[2], scope)
     elif expr[0] == 'sequence':
-        return get_type(expr[2], scope)
+        return get_type(expr[1][-1], scope)
     elif expr[0] in ['block', 'uminus', 'print']:
         return get_type(expr[1], scope)
     elif expr[0] == 'if':
         return get_if_type(expr, scope)
+    elif expr[0] in ['timeit', 'sin', 'cos']:
+        return float
+    elif expr[0] == 'not':
+        return bool
+    elif expr[0] == 'let':
+        let_scope = Scope(parent=scope)
+        for name, val in expr[1]:
+            let_scope.types[name] = get_type(val, let_scope)
+        return get_type(expr[2], let_scope)
     else:
         return expr[1]
 
@@ -224,10 +541,11 @@ def get_type(expr, scope):
 def p_expression_convert(p):
     'expression : convert expression'
     type_to_convert = str_to_type[p[1].lstrip('to')]
-    p[0] = ('convert', type_to_convert, p[2])
     # conversions on primitives done at compile time
     if type(p[2]) != tuple:
-        p[0] = eval_convert(p[0], None)
+        p[0] = eval_convert(('convert', type_to_convert, p[2]), None)
+    else:
+        p[0] = node('convert', type_to_convert, p[2], at=position(p, 1))
 
 
 def eval_convert(expr, scope):
@@ -241,7 +559,10 @@ def eval_convert(expr, scope):
 
 def p_expression_not(p):
     "expression : NOT expression"
-    p[0] = ('not', p[2])
+    if type(p[2]) != tuple:
+        p[0] = eval_not(('not', p[2]), None)
+    else:
+        p[0] = node('not', p[2], at=position(p, 1))
 
 
 def eval_not(expr, scope):
@@ -251,13 +572,21 @@ def eval_not(expr, scope):
 def p_expression_special_fun(p):
     """expression : PRINT expression
                     | SIN expression
-                    | COS expression"""
-    p[0] = (p[1], p[2])
+                    | COS expression
+                    | TIMEIT expression"""
+    # sin and cos of primitives are evaluated at compile time, unless they fail - then they fail at run time
+    if p[1] in ['sin', 'cos'] and type(p[2]) != tuple:
+        try:
+            p[0] = evaluate((p[1], p[2]), None)
+            return
+        except (TypeError, ValueError):
+            pass
+    p[0] = node(p[1], p[2], at=position(p, 1))
 
 
 def eval_print(expr, scope):
     val = evaluate(expr[1], scope)
-    print(val)
+    output.write(val)
     return val
 
 
@@ -269,9 +598,24 @@ def eval_cos(expr, scope):
     return math.cos(evaluate(expr[1], scope))
 
 
+def time_expression(expr, scope, number=None, repeat=7):
+    """Times evaluation of expr, like Python's timeit - returns the number of loops per run
+    and the time per loop, in seconds, of each of the runs.
+    If number is not given, it's chosen so that a run takes at least 0.2 seconds"""
+    timer = timeit.Timer(lambda: evaluate(expr, scope))
+    if number is None:
+        number, _ = timer.autorange()
+    return number, [run / number for run in timer.repeat(repeat=repeat, number=number)]
+
+
+def eval_timeit(expr, scope):
+    _, times = time_expression(expr[1], scope)
+    return min(times)
+
+
 def p_expression_assign(p):
     'expression : NAME "=" expression'
-    p[0] = ('assign', p[1], p[3])
+    p[0] = node('assign', p[1], p[3], at=position(p, 1))
 
 
 def eval_assign(expression, scope):
@@ -292,7 +636,7 @@ def p_type(p):
 
 def p_expression_declare(p):
     'expression : type NAME "=" expression'
-    p[0] = ('declare', p[1], p[2], p[4])
+    p[0] = node('declare', p[1], p[2], p[4], at=position(p, 2))
 
 
 def eval_declare(expr, scope: Scope):
@@ -304,20 +648,26 @@ def eval_declare(expr, scope: Scope):
 
 def p_statement_def(p):
     """statement : DEF NAME args '-' '>' type '=' expression"""
+    p[0] = [('def', p[2], p[3], p[6], p[8])]
+
+
+def define_function(statement):
     if RUNNING_AS_REPL:
-        print(p[1:])
-    if p[2] in functions.keys():
-        raise NameError(f"Function {p[2]} already exists")
-    function_types[p[2]] = p[6]
-    arguments[p[2]] = []
+        output.write(statement)
+    _, fun, args, return_type, body = statement
+    if fun in functions.keys() or fun in parallel_reductions or fun in input_builtins:
+        raise NameError(f"Function {fun} already exists")
+    function_types[fun] = return_type
+    arguments[fun] = []
     function_scope = Scope(parent=global_scope)
-    function_scopes[p[2]] = function_scope
-    for arg_type, name in p[3]:
-        arguments[p[2]].append(name)
+    function_scopes[fun] = function_scope
+    for arg_type, name in args:
+        arguments[fun].append(name)
         function_scope.declare(name, arg_type, None)
 
-    functions[p[2]] = p[8]
-    p[0] = None
+    functions[fun] = body
+    # cached parse results may depend on the functions defined so far
+    parse_cache.clear()
 
 
 def p_args(p):
@@ -331,7 +681,7 @@ def p_args(p):
 
 def p_expression_call(p):
     """expression : NAME '(' call_args ')'"""
-    p[0] = ('call', p[1], p[3])
+    p[0] = node('call', p[1], p[3], at=position(p, 1))
 
 
 def p_call_args(p):
@@ -348,13 +698,22 @@ def p_call_args(p):
 
 def eval_call(expr, scope: Scope):
     _, fun, args = expr
+    if fun in parallel_reductions:
+        return eval_parallel_reduction(expr, scope)
+    if fun in input_builtins:
+        return eval_input(expr, scope)
     if fun not in functions.keys():
         raise NameError(f"Function {fun} undefined")
     if len(args) != len(arguments[fun]):
-        print(args, arguments[fun])
+        output.write(f"{args} {arguments[fun]}")
         raise ValueError(f"Expected {len(arguments[fun])} arguments for {fun}, got "
                          f"{len(args)}")
-    parent_scope = function_scopes[fun] if scope == global_scope else scope
+    if scope == global_scope:
+        parent_scope = function_scopes[fun]
+    elif type(scope) == LetScope and scope.is_top_level():
+        parent_scope = scope.over(function_scopes[fun])
+    else:
+        parent_scope = scope
     new_scope = Scope(parent=parent_scope)
     arg_values = [arg for arg in args]
     for i, (arg, expected) in enumerate(zip(args, arguments[fun])):
@@ -374,29 +733,615 @@ def eval_call(expr, scope: Scope):
     return evaluate(functions[fun], new_scope)
 
 
+# constructs with side effects (or results that differ between evaluations)
+impure_constructs = ['print', 'timeit']
+
+
+def is_pure(expr, definitions=None, visited_functions=None):
+    """Checks if evaluating expr has no side effects, including in the functions it calls.
+
+    Assignments and declarations only ever change the innermost scope, so they aren't side effects
+    of a function call. Calls to functions missing from definitions (functions by default) are considered impure
+    """
+    if definitions is None:
+        definitions = functions
+    if visited_functions is None:
+        visited_functions = set()
+    if type(expr) == list:
+        return all(is_pure(e, definitions, visited_functions) for e in expr)
+    if type(expr) != tuple:
+        return True
+    if expr[0] in impure_constructs:
+        return False
+    if expr[0] == 'call':
+        fun = expr[1]
+        if fun in parallel_reductions or fun not in definitions:
+            return False
+        if fun not in visited_functions:
+            visited_functions.add(fun)
+            if not is_pure(definitions[fun], definitions, visited_functions):
+                return False
+        return is_pure(expr[2], definitions, visited_functions)
+    return all(is_pure(e, definitions, visited_functions) for e in expr[1:])
+
+
+def changes_names(expr):
+    """Checks if evaluating expr can assign or declare a name in the scope it's evaluated in (or in its blocks)"""
+    if type(expr) == list:
+        return any(changes_names(e) for e in expr)
+    if type(expr) != tuple:
+        return False
+    return expr[0] in ['assign', 'declare'] or any(changes_names(e) for e in expr[1:])
+
+
+def can_share_subexpressions(expr, definitions):
+    """Checks if repeated subexpressions of expr can be computed once, before it, with expr evaluated in a new scope
+    of a 'let' - it has to be pure, and can't change any names, which would be changed in that scope only"""
+    return is_pure(expr, definitions) and not changes_names(expr)
+
+
+def is_trivial(expr):
+    return type(expr) != tuple or expr[0] == 'name'
+
+
+# constructs always evaluating all of their operands, subexpressions of which can be computed once
+straight_line_constructs = ['binop', 'uminus', 'typed_binop', 'typed_uminus', 'convert', 'inlined', 'not', 'sin',
+                            'cos', 'call']
+# counter for names of the temporary variables, they start with '$' so they never clash with user names
+temporaries = 0
+
+
+@shared_results
+def eliminate_common_subexpressions(expr, definitions):
+    """Evaluates repeated subexpressions once, binding them to temporary variables with a 'let' expression.
+
+    Only pure expressions are transformed, and their subexpressions in positions that are always evaluated -
+    e.g. not in the branches of an 'if', which might not be evaluated at all
+    """
+    if type(expr) == list:
+        return [eliminate_common_subexpressions(e, definitions) for e in expr]
+    if type(expr) != tuple:
+        return expr
+    if expr[0] in straight_line_constructs and can_share_subexpressions(expr, definitions):
+        return eliminate_in_region(expr, definitions)
+    return node.rebuild(expr, [eliminate_common_subexpressions(e, definitions) if type(e) in [tuple, list] else e
+                               for e in expr])
+
+
+def region_subexpressions(expr):
+    """Yields the subexpressions of a pure expression that are evaluated whenever it is"""
+    if type(expr) != tuple or expr[0] not in straight_line_constructs:
+        return
+    yield expr
+    for e in (expr[2] if expr[0] == 'call' else expr[1:]):
+        yield from region_subexpressions(e)
+
+
+def replace_subexpression(expr, old_key, new):
+    if type(expr) != tuple or expr[0] not in straight_line_constructs:
+        return expr
+    if repr(expr) == old_key:
+        return new
+    if expr[0] == 'call':
+        return node.rebuild(expr, ['call', expr[1], [replace_subexpression(e, old_key, new) for e in expr[2]]])
+    return node.rebuild(expr, [replace_subexpression(e, old_key, new) for e in expr])
+
+
+def optimize_branches(expr, definitions):
+    """Eliminates common subexpressions in the parts of a pure expression that are not always evaluated"""
+    if type(expr) != tuple or expr[0] not in straight_line_constructs:
+        return eliminate_common_subexpressions(expr, definitions)
+    if expr[0] == 'call':
+        return node.rebuild(expr, ['call', expr[1], [optimize_branches(e, definitions) for e in expr[2]]])
+    return node.rebuild(expr, [optimize_branches(e, definitions) if type(e) in [tuple, list] else e for e in expr])
+
+
+def eliminate_in_region(expr, definitions):
+    global temporaries
+    region = expr
+    expr = optimize_branches(expr, definitions)
+    temps = []
+    while True:
+        # repr tells apart equal values of different types, e.g. 1, 1.0 and True
+        counts = {}
+        examples = {}
+        for root in [expr] + [val for _, val in temps]:
+            for e in region_subexpressions(root):
+                key = repr(e)
+                counts[key] = counts.get(key, 0) + 1
+                examples.setdefault(key, e)
+        repeated = [key for key, count in counts.items() if count > 1]
+        if not repeated:
+            break
+        # the biggest first, its subexpressions are then only counted once
+        key = max(repeated, key=len)
+        temporaries += 1
+        name = f'${temporaries}'
+        temps = [(t, replace_subexpression(val, key, node('name', name))) for t, val in temps]
+        # temporaries are defined in order of dependencies - the new one is smaller than all the others
+        temps.insert(0, (name, examples[key]))
+        expr = replace_subexpression(expr, key, node('name', name))
+    return node.rebuild(region, ['let', temps, expr]) if temps else expr
+
+
+# maximum number of Python function calls made evaluating a call at compile time, 0 disables it
+FOLD_BUDGET = 100000
+# maximum size of a number (in bits) or a string (in characters) computed by a '^' or '*' at compile time
+FOLD_SIZE = 1 << 16
+
+
+class FoldBudgetExceeded(Exception):
+    pass
+
+
+def reads_only_arguments(fun, visited_functions=None):
+    """Checks if the only variables fun reads or assigns, also in the functions it calls, are its arguments
+    (or temporaries bound inside it), so its result depends only on the values of the arguments"""
+    if visited_functions is None:
+        visited_functions = set()
+    visited_functions.add(fun)
+
+    def check(expr):
+        if type(expr) == list:
+            return all(check(e) for e in expr)
+        if type(expr) != tuple:
+            return True
+        if expr[0] in ['name', 'assign', 'declare']:
+            name = expr[2] if expr[0] == 'declare' else expr[1]
+            if name not in arguments[fun] and not name.startswith('$'):
+                return False
+        if expr[0] == 'call' and expr[1] not in visited_functions:
+            if expr[1] not in functions or not reads_only_arguments(expr[1], visited_functions):
+                return False
+        return all(check(e) for e in expr[1:])
+
+    return check(functions[fun])
+
+
+def is_foldable(expr):
+    if type(expr) != tuple or expr[0] not in straight_line_constructs:
+        return False
+    operands = expr[2] if expr[0] == 'call' else expr[1:]
+    if any(type(e) == tuple for e in operands):
+        return False
+    if expr[0] != 'call':
+        return True
+    fun = expr[1]
+    return fun in functions and is_pure(expr) and reads_only_arguments(fun)
+
+
+def result_size(fn, val1, val2):
+    """Estimates the size of fn(val1, val2) for '^' and '*' (see FOLD_SIZE), 0 for other operations"""
+    if fn is operator.pow and type(val1) == int and type(val2) == int and abs(val1) > 1 and val2 > 0:
+        return (val1.bit_length() - 1) * val2
+    if fn is operator.mul:
+        if type(val1) == str and type(val2) == int:
+            return len(val1) * val2
+        if type(val1) == int and type(val2) == str:
+            return val1 * len(val2)
+        if type(val1) == int and type(val2) == int:
+            return val1.bit_length() + val2.bit_length()
+    return 0
+
+
+def evaluate_with_budget(expr, budget: int):
+    """Evaluates expr, abandoning it after budget Python function calls, or before a '^' or '*' with a result
+    bigger than FOLD_SIZE - a single operation on big numbers can take longer than any budget.
+
+    The operands of an operation are the last two values returned by evaluate() before the operator is called
+    """
+    calls = 0
+    operands = [None, None]
+
+    def check(frame, event, arg):
+        nonlocal calls
+        if event == 'call':
+            calls += 1
+            if calls > budget:
+                raise FoldBudgetExceeded()
+        elif event == 'return' and frame.f_code is evaluate.__code__:
+            operands[0], operands[1] = operands[1], arg
+        elif event == 'c_call' and result_size(arg, *operands) > FOLD_SIZE:
+            raise FoldBudgetExceeded()
+
+    previous_profile = sys.getprofile()
+    sys.setprofile(check)
+    try:
+        return evaluate(expr, global_scope)
+    finally:
+        sys.setprofile(previous_profile)
+
+
+@shared_results
+def fold_constants(expr):
+    """Evaluates pure operations on constants at compile time, including calls of defined functions that depend
+    only on their (constant) arguments. Evaluation of a call is abandoned after FOLD_BUDGET Python function calls,
+    and of any expression before computing a value bigger than FOLD_SIZE. Expressions failing to evaluate
+    are left to fail at run time, and timed ones to be timed"""
+    if type(expr) == list:
+        return [fold_constants(e) for e in expr]
+    if type(expr) != tuple or expr[0] == 'timeit':
+        return expr
+    expr = node.rebuild(expr, [fold_constants(e) if type(e) in [tuple, list] else e for e in expr])
+    if not is_foldable(expr) or (expr[0] == 'call' and not FOLD_BUDGET):
+        return expr
+    try:
+        if expr[0] == 'call':
+            val = evaluate_with_budget(expr, FOLD_BUDGET)
+            # the result of a function is not converted to its declared type
+            return val if type(val) == function_types[expr[1]] else expr
+        if expr[0] == 'binop' and result_size(binary_operators[expr[2]], expr[1], expr[3]) > FOLD_SIZE:
+            return expr
+        if expr[0] == 'typed_binop' and result_size(*expr[2:]) > FOLD_SIZE:
+            return expr
+        return evaluate(expr, global_scope)
+    except Exception:
+        return expr
+
+
+# maximum number of nodes in the body of an inlined function, 0 disables inlining
+INLINE_SIZE = 20
+
+
+def expression_size(expr):
+    if type(expr) == list:
+        return sum(expression_size(e) for e in expr)
+    if type(expr) != tuple:
+        return 0
+    return 1 + sum(expression_size(e) for e in expr[1:])
+
+
+def calls_function(expr, fun, visited_functions=None):
+    """Checks if evaluating expr can call fun, directly or through the functions it calls"""
+    if visited_functions is None:
+        visited_functions = set()
+    if type(expr) == list:
+        return any(calls_function(e, fun, visited_functions) for e in expr)
+    if type(expr) != tuple:
+        return False
+    if expr[0] == 'call':
+        if expr[1] == fun:
+            return True
+        if expr[1] in functions and expr[1] not in visited_functions:
+            visited_functions.add(expr[1])
+            if calls_function(functions[expr[1]], fun, visited_functions):
+                return True
+    return any(calls_function(e, fun, visited_functions) for e in expr[1:])
+
+
+def inlinable_body(fun):
+    """Returns the body of fun if its calls can be replaced by it, None otherwise.
+
+    The body, evaluated in the caller's scope with the arguments substituted, has to see the same names as
+    in the scope of a call - so it can't assign or declare names, and can only call functions which depend just
+    on their arguments. It also has to be small, non-recursive and of the declared return type
+    """
+    body = functions[fun]
+
+    def check(expr):
+        if type(expr) == list:
+            return all(check(e) for e in expr)
+        if type(expr) != tuple:
+            return True
+        if expr[0] in ['assign', 'declare']:
+            return False
+        if expr[0] == 'call' and expr[1] not in input_builtins:
+            if expr[1] not in functions or not reads_only_arguments(expr[1]):
+                return False
+        return all(check(e) for e in expr[1:])
+
+    if expression_size(body) > INLINE_SIZE or calls_function(body, fun) or not check(body):
+        return None
+    try:
+        # the result of a function is not converted to its declared type
+        if get_type(body, function_scopes[fun]) != function_types[fun]:
+            return None
+    except Exception:
+        return None
+    return body
+
+
+def substitute_names(expr, values):
+    if type(expr) == list:
+        return [substitute_names(e, values) for e in expr]
+    if type(expr) != tuple:
+        return expr
+    if expr[0] == 'name':
+        return values.get(expr[1], expr)
+    return node.rebuild(expr, [substitute_names(e, values) if type(e) in [tuple, list] else e for e in expr])
+
+
+@shared_results
+def inline_calls(expr, scope):
+    """Replaces calls of small functions (see inlinable_body) with their bodies, with the arguments substituted.
+
+    Arguments are converted to the types of the parameters like in a call - values at compile time, other arguments
+    at run time, unless their type in scope is known to be right. Arguments other than values are bound to temporary
+    variables first, so that they are evaluated (and converted) once, in order, before the body - even if it doesn't
+    use them. Names known to be declared with the right type are just substituted, unless another argument can
+    change them
+    """
+    global temporaries
+    if type(expr) == list:
+        return [inline_calls(e, scope) for e in expr]
+    if type(expr) != tuple:
+        return expr
+    expr = node.rebuild(expr, [inline_calls(e, scope) if type(e) in [tuple, list] else e for e in expr])
+    if not INLINE_SIZE or expr[0] != 'call' or expr[1] not in functions:
+        return expr
+    _, fun, args = expr
+    if len(args) != len(arguments[fun]):
+        return expr
+    body = inlinable_body(fun)
+    if body is None:
+        return expr
+    values = {}
+    temps = []
+    for arg, name in zip(args, arguments[fun]):
+        arg_type = function_scopes[fun].get_type(name)
+        if type(arg) != tuple:
+            try:
+                values[name] = arg if type(arg) == arg_type else arg_type(arg)
+            except (TypeError, ValueError):
+                return expr
+            continue
+        if known_type(arg, scope) == arg_type and arg[0] == 'name' and not changes_names(args):
+            # the body can't change it either
+            values[name] = arg
+            continue
+        if known_type(arg, scope) != arg_type:
+            arg = node.rebuild(arg, ['convert', arg_type, arg])
+        temporaries += 1
+        temps.append((f'${temporaries}', arg))
+        values[name] = node('name', f'${temporaries}')
+    body = fold_constants(substitute_names(body, values))
+    if temps:
+        body = node.rebuild(expr, ['let', temps, body])
+    # the type of a call is known without checking its body, so type checks at run time keep being cheap.
+    # Like the result of a call, the value isn't converted to it
+    if type(body) == tuple and body[0] not in ['convert', 'inlined']:
+        return node.rebuild(expr, ['inlined', function_types[fun], body])
+    return body
+
+
+def eval_inlined(expr, scope):
+    return evaluate(expr[2], scope)
+
+
+# whether binop and uminus nodes with operands of known types are replaced with typed nodes
+SPECIALIZE = True
+
+
+class TypeScope(Scope):
+    """The types of names at a point of a program, as known at compile time. A name which can have different types
+    there is mapped to None, and looking it up fails like looking up an undefined name"""
+
+    def __init__(self, parent=None, types=None):
+        super().__init__(parent)
+        self.types.update(types or {})
+
+    def get_type(self, name: str):
+        type_class = super().get_type(name)
+        if type_class is None:
+            raise LookupError(f"Type of {name} unknown")
+        return type_class
+
+
+def known_type(expr, scope):
+    """The type get_type gives expr in scope, None if it can't tell"""
+    try:
+        return get_type(expr, scope)
+    except Exception:
+        return None
+
+
+def declared_types(expr, types):
+    """Collects the types names are declared with in the scope expr is evaluated in (not in its blocks and lets)"""
+    if type(expr) == list:
+        for e in expr:
+            declared_types(e, types)
+    if type(expr) != tuple or expr[0] in ['block', 'let']:
+        return types
+    if expr[0] == 'declare':
+        types.setdefault(expr[2], set()).add(expr[1])
+    for e in expr[1:]:
+        declared_types(e, types)
+    return types
+
+
+def type_scope(expr, parent):
+    """The types of names known throughout the evaluation of expr in a new scope with the given parent.
+
+    A name declared in expr keeps its type only if it's declared with the type it has in parent - before the
+    declaration, it's looked up there
+    """
+    types = {}
+    for name, declared in declared_types(expr, {}).items():
+        parent_type = known_type(('name', name), parent)
+        types[name] = parent_type if declared == {parent_type} else None
+    return TypeScope(parent, types)
+
+
+@shared_results
+def specialize_operators(expr, scope, in_order):
+    """Replaces binop and uminus nodes, whose operands' types are the same whenever they are evaluated, with
+    ('typed_binop', type, function, expr1, expr2) and ('typed_uminus', type, function, expr) nodes. The function
+    from the operator module is called directly, with no type checks or operator lookups at run time.
+
+    Declarations make the types of names known from then on, but only in statements evaluated one after another
+    (in_order) - the type of an expression can be checked before any of it is evaluated, e.g. by a binop
+    """
+    if type(expr) == list:
+        return [specialize_operators(e, scope, False) for e in expr]
+    if type(expr) != tuple:
+        return expr
+    if expr[0] == 'sequence':
+        items = []
+        for item in expr[1]:
+            items.append(specialize_operators(item, scope, in_order))
+            # another declaration of the name would fail
+            if in_order and type(item) == tuple and item[0] == 'declare':
+                scope = TypeScope(scope, {item[2]: item[1]})
+        return node.rebuild(expr, ['sequence', items])
+    if expr[0] == 'block':
+        return node.rebuild(expr, ['block', specialize_operators(expr[1], type_scope(expr[1], scope), in_order)])
+    if expr[0] == 'let':
+        let_scope = type_scope([val for _, val in expr[1]] + [expr[2]], scope)
+        temps = []
+        for name, val in expr[1]:
+            temps.append((name, specialize_operators(val, let_scope, False)))
+            let_scope = TypeScope(let_scope, {name: known_type(val, let_scope)})
+        return node.rebuild(expr, ['let', temps, specialize_operators(expr[2], let_scope, in_order)])
+    if expr[0] == 'if':
+        _, condition, true_branch, false_branch = expr
+        return node.rebuild(expr, ['if', specialize_operators(condition, scope, False),
+                                   specialize_operators(true_branch, scope, in_order),
+                                   specialize_operators(false_branch, scope, in_order)])
+    if expr[0] == 'while':
+        return node.rebuild(expr, ['while', specialize_operators(expr[1], scope, False),
+                                   specialize_operators(expr[2], scope, in_order)])
+    if expr[0] == 'call' and expr[1] in arguments:
+        # the arguments are evaluated in the scope of the call, where the parameters may be declared already
+        arg_scope = TypeScope(scope, {name: None for name in arguments[expr[1]]})
+        return node.rebuild(expr, ['call', expr[1], specialize_operators(expr[2], arg_scope, False)])
+    # operands are specialized in the same scope - declarations in them don't change the types of names
+    expr = node.rebuild(expr, [specialize_operators(e, scope, False) if type(e) in [tuple, list] else e
+                               for e in expr])
+    if expr[0] not in ['binop', 'uminus']:
+        return expr
+    operands = [expr[1], expr[3]] if expr[0] == 'binop' else [expr[1]]
+    # the type of an operand which wasn't specialized isn't known, and computing it would take time exponential
+    # in its depth. The types of the specialized ones are stored in them
+    if any(type(e) == tuple and e[0] in ['binop', 'uminus'] for e in operands):
+        return expr
+    operand_types = [known_type(e, scope) for e in operands]
+    expr_type = known_type(expr, scope)
+    if expr_type is None or None in operand_types:
+        return expr
+    if expr[0] == 'binop':
+        _, val1, op, val2 = expr
+        try:
+            typecheck_binop(*operand_types, op)
+        except AssertionError:
+            return expr
+        return node.rebuild(expr, ['typed_binop', expr_type, binary_operators[op], val1, val2])
+    if are_numbers(expr_type):
+        return node.rebuild(expr, ['typed_uminus', expr_type, operator.neg, expr[1]])
+    return expr
+
+
+# parallel builtins - reduction(fun(i) for i in range(a, b)), computed by a pool of processes
+parallel_reductions = {'psum': sum, 'pmax': max}
+# ranges shorter than that are reduced in this process
+PARALLEL_THRESHOLD = 10000
+
+
+def load_definitions(definitions):
+    """Initializes a worker process with the functions and global variables of the parent"""
+    global global_scope
+    global_scope = definitions['global_scope']
+    for name in ['functions', 'function_types', 'arguments', 'function_scopes']:
+        globals()[name].update(definitions[name])
+
+
+def reduce_range(reduction: str, fun: str, start: int, stop: int):
+    return parallel_reductions[reduction](eval_call(('call', fun, [i]), global_scope) for i in range(start, stop))
+
+
+def eval_parallel_reduction(expr, scope: Scope):
+    _, reduction, args = expr
+    if len(args) != 3 or type(args[0]) != tuple or args[0][0] != 'name':
+        raise ValueError(f"Expected a function name and a range for {reduction}, e.g. {reduction}(f, 0, 10)")
+    fun = args[0][1]
+    if fun not in functions.keys():
+        raise NameError(f"Function {fun} undefined")
+    if len(arguments[fun]) != 1 or not are_numbers(function_types[fun]):
+        raise TypeError(f"{reduction} expects a function of 1 argument returning a number, got {fun}")
+    if not is_pure(('call', fun, [])):
+        raise ValueError(f"{fun} has side effects, it cannot be evaluated in parallel")
+    start, stop = evaluate(args[1], scope), evaluate(args[2], scope)
+    if type(start) != int or type(stop) != int:
+        raise TypeError(f"Range of {reduction} should be of type {int}, got {type(start)} and {type(stop)}")
+    if start >= stop:
+        if reduction == 'psum':
+            return function_types[fun](0)
+        raise ValueError(f"{reduction} of an empty range")
+
+    workers = os.cpu_count() or 1
+    if stop - start < PARALLEL_THRESHOLD or workers == 1:
+        return reduce_range(reduction, fun, start, stop)
+    definitions = {'global_scope': global_scope, 'functions': functions, 'function_types': function_types,
+                   'arguments': arguments, 'function_scopes': function_scopes}
+    # a few chunks per worker, so that uneven chunks even out
+    chunk_size = -(-(stop - start) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=load_definitions, initargs=(definitions,)) as pool:
+        chunks = [pool.submit(reduce_range, reduction, fun, i, min(i + chunk_size, stop))
+                  for i in range(start, stop, chunk_size)]
+        return parallel_reductions[reduction](chunk.result() for chunk in chunks)
+
+
+# input builtins and their types - readint(), readint("file.txt") etc.
+input_builtins = {'readint': int, 'readfloat': float, 'readline': str, 'eof': bool}
+
+
+def eval_input(expr, scope):
+    _, fun, args = expr
+    if len(args) > 1:
+        raise ValueError(f"Expected at most 1 argument for {fun}, got {len(args)}")
+    file_name = evaluate(args[0], scope) if args else None
+    if file_name is not None and type(file_name) != str:
+        raise TypeError(f"Argument 0 should be of type {str}, got {type(file_name)}")
+    if file_name not in input_readers:
+        input_readers[file_name] = InputReader(open(file_name, 'r'))
+    reader = input_readers[file_name]
+    if fun == 'eof':
+        return reader.eof()
+    if fun == 'readline':
+        return reader.line()
+    token = reader.token()
+    try:
+        return input_builtins[fun](token)
+    except ValueError:
+        raise TypeError(f"Cannot convert '{token}' to type {input_builtins[fun]}")
+
+
 def p_error_expression(p):
     "expression : error ';' expression"
     p[0] = p[3]
 
 
+def sequence_items(expr):
+    return expr[1] if type(expr) == tuple and expr[0] == 'sequence' else [expr]
+
+
 def p_expression_sequence(p):
-    "expression : expression ';' expression"
-    first_expr = p[1]
+    """expression : expression ';' expression"""
+    # sequences are flat - ('sequence', [expr1, expr2, ...]). Since ';' is left associative,
+    # the sequence built so far is extended in place, so parsing is linear in its length (and it isn't shared)
+    # only the first expression of a sequence is dropped if it has no side effects - the ones after it
+    # are kept, since e.g. a call can have some
     no_side_effect_constructs = ['binop', 'uminus', 'name', 'convert', 'call']
-    if type(first_expr) != tuple or first_expr[0] in no_side_effect_constructs:
-        p[0] = p[3]
+    first_expr = p[1]
+    if type(first_expr) == tuple and first_expr[0] == 'sequence':
+        items = first_expr[1]
+    elif type(first_expr) != tuple or first_expr[0] in no_side_effect_constructs:
+        items = []
     else:
-        p[0] = ('sequence', p[1], p[3])
+        items = [node.occurrence(first_expr)]
+    items.extend(map(node.occurrence, sequence_items(p[3])))
+    p[0] = ('sequence', items) if len(items) > 1 else items[0]
 
 
 def eval_sequence(expression, scope):
-    evaluate(expression[1], scope)
-    return evaluate(expression[2], scope)
+    val = None
+    for expr in expression[1]:
+        val = evaluate(expr, scope)
+    return val
 
 
 def p_expression_block(p):
     """expression : '{' expression '}'"""
-    p[0] = ('block', p[2])
+    p[0] = node('block', p[2], at=position(p, 1))
 
 
 def eval_block(expr, scope):
@@ -404,9 +1349,32 @@ def eval_block(expr, scope):
     return evaluate(expr[1], new_scope)
 
 
+class LetScope(Scope):
+    """The scope of the temporary variables of a 'let'. It doesn't nest calls - a call in a let at the top level
+    is evaluated like a call from the top level, only seeing the temporary variables too"""
+
+    def is_top_level(self):
+        return self.parent is global_scope or type(self.parent) == LetScope and self.parent.is_top_level()
+
+    def over(self, scope):
+        """This scope and the let scopes it's in, with scope in place of the top level"""
+        let_scope = LetScope(parent=self.parent.over(scope) if type(self.parent) == LetScope else scope)
+        let_scope.types = self.types
+        let_scope.values = self.values
+        return let_scope
+
+
+def eval_let(expr, scope):
+    _, temps, body = expr
+    let_scope = LetScope(parent=scope)
+    for name, val in temps:
+        let_scope.declare(name, get_type(val, let_scope), val)
+    return evaluate(body, let_scope)
+
+
 def p_expression_if(p):
     """expression : IF expression THEN expression else_expression"""
-    p[0] = ('if', p[2], p[4], p[5])
+    p[0] = node('if', p[2], p[4], p[5], at=position(p, 1))
 
 
 def get_if_type(expr, scope):
@@ -439,7 +1407,7 @@ def p_else_expression(p):
 
 def p_expression_while(p):
     """expression : WHILE expression DO expression END"""
-    p[0] = ('while', p[2], p[4])
+    p[0] = node('while', p[2], p[4], at=position(p, 1))
 
 
 def eval_while(expr, scope):
@@ -469,15 +1437,16 @@ def p_expression_binop(p):
     elif (val2 == 0 and op in ['+', '-']) or (val2 == 1 and op in ['*', '/']):
         p[0] = val1
     else:
-        if val1 == 2 and op == '*':
-            p[0] = ('binop', val2, '+', val2)
-        elif val2 == 2 and op == '*':
-            p[0] = ('binop', val1, '+', val1)
-        else:
-            p[0] = ('binop', val1, op, val2)
-        # binop on 2 primitives is evaluated at compile time
-        if type(val1) != tuple and type(val2) != tuple:
+        # 2 * x -> x + x, only if evaluating x twice is trivially cheap
+        # binop on 2 primitives is evaluated at compile time, unless its result is too big (see FOLD_SIZE)
+        if type(val1) != tuple and type(val2) != tuple and result_size(binary_operators[op], val1, val2) <= FOLD_SIZE:
             p[0] = eval_binop(('binop', val1, op, val2), None)
+        elif val1 == 2 and op == '*' and is_trivial(val2):
+            p[0] = node('binop', val2, '+', val2, at=position(p, 2))
+        elif val2 == 2 and op == '*' and is_trivial(val1):
+            p[0] = node('binop', val1, '+', val1, at=position(p, 2))
+        else:
+            p[0] = node('binop', val1, op, val2, at=position(p, 2))
 
 
 def get_binop_type(val1, val2, op, scope):
@@ -510,6 +1479,19 @@ def typecheck_binop(type1, type2, op):
         assert are_numbers(type1, type2) or type1 == type2
 
 
+binary_operators = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '^': operator.pow,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '>': operator.gt,
+    '<': operator.lt,
+}
+
+
 def eval_binop(expr, scope: Scope):
     _, val1, op, val2 = expr
     try:
@@ -518,32 +1500,19 @@ def eval_binop(expr, scope: Scope):
         raise TypeError(f"Unsupported operand {op} between instances of "
                         f"{get_type(val1, scope)} and {get_type(val2, scope)}")
 
-    val1, val2 = evaluate(val1, scope), evaluate(val2, scope)
-    if op == '+':
-        return val1 + val2
-    elif op == '-':
-        return val1 - val2
-    elif op == '*':
-        return val1 * val2
-    elif op == '/':
-        return val1 / val2
-    elif op == '^':
-        return val1 ** val2
-    elif op == '==':
-        return val1 == val2
-    elif op == '!=':
-        return val1 != val2
-    elif op == '>':
-        return val1 > val2
-    elif op == '<':
-        return val1 < val2
+    return binary_operators[op](evaluate(val1, scope), evaluate(val2, scope))
+
+
+def eval_typed_binop(expr, scope: Scope):
+    return expr[2](evaluate(expr[3], scope), evaluate(expr[4], scope))
 
 
 def p_expression_uminus(p):
     "expression : '-' expression %prec UMINUS"
-    p[0] = ('uminus', p[2])
     if type(p[2]) != tuple:
-        p[0] = eval_uminus(p[0], None)
+        p[0] = eval_uminus(('uminus', p[2]), None)
+    else:
+        p[0] = node('uminus', p[2], at=position(p, 1))
 
 
 def eval_uminus(expr, scope: Scope):
@@ -553,6 +1522,10 @@ def eval_uminus(expr, scope: Scope):
     return -evaluate(expr[1], scope)
 
 
+def eval_typed_uminus(expr, scope: Scope):
+    return expr[2](evaluate(expr[3], scope))
+
+
 def p_expression_group(p):
     "expression : '(' expression ')'"
     p[0] = p[2]
@@ -569,7 +1542,7 @@ def p_expression_value(p):
 
 def p_expression_name(p):
     "expression : NAME"
-    p[0] = ('name', p[1])
+    p[0] = node('name', p[1], at=position(p, 1))
 
 
 def eval_name(expr, scope):
@@ -581,6 +1554,9 @@ eval_fun = {
     'assign': eval_assign,
     'binop': eval_binop,
     'uminus': eval_uminus,
+    'typed_binop': eval_typed_binop,
+    'typed_uminus': eval_typed_uminus,
+    'inlined': eval_inlined,
     'while': eval_while,
     'if': eval_if,
     'sequence': eval_sequence,
@@ -589,10 +1565,12 @@ eval_fun = {
     'call': eval_call,
     'declare': eval_declare,
     'block': eval_block,
+    'let': eval_let,
     'print': eval_print,
     'not': eval_not,
     'sin': eval_sin,
     'cos': eval_cos,
+    'timeit': eval_timeit,
 }
 
 
@@ -604,6 +1582,9 @@ def evaluate(expression: Union[tuple, float, int], scope: Scope):
 
 
 def p_error(p):
+    global syntax_errors
+    syntax_errors += 1
+    output.flush()
     if p:
         print("Syntax error at '%s'" % p.value)
         # Read ahead looking for a terminating ";"
@@ -627,23 +1608,559 @@ def p_empty(p):
 
 
 parser = yacc.yacc()
+syntax_errors = 0
+
+
+class ParseCache:
+    """LRU cache from source text to its parsed and optimized statements.
+
+    Statements are optimized using the functions defined so far, so the cache is cleared
+    whenever a function is defined
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, source: str):
+        if source in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(source)
+            return self.entries[source]
+        self.misses += 1
+        return None
+
+    def put(self, source: str, statements: list):
+        self.entries[source] = statements
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
 
-if len(sys.argv) > 1:
-    RUNNING_AS_REPL = False
-    with open(sys.argv[1], 'r') as f:
+    def clear(self):
+        self.entries.clear()
+
+    def __str__(self):
+        lookups = self.hits + self.misses
+        hit_rate = self.hits / lookups if lookups else 0
+        return f"{self.hits} hits, {self.misses} misses ({hit_rate:.1%} hit rate), " \
+               f"{len(self.entries)}/{self.maxsize} entries"
+
+
+parse_cache = ParseCache()
+
+
+class MemoryReport:
+    """Peak and net memory allocated by each top-level statement, measured with tracemalloc.
+
+    Expressions of a top-level sequence are measured separately
+    """
+
+    def __init__(self, top=10):
+        self.top = top
+        # (peak, net, source of the statement) for each evaluated statement
+        self.records = []
+        # the source being run, which the statements are parsed from
+        self.source = ''
+        self.position = None
+        tracemalloc.start()
+
+    def measure(self, expr, scope):
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
         try:
-            yacc.parse(f.read())
-        except Exception as e:
-            print(type(e), e)
-else:
-    while True:
+            return evaluate(expr, scope)
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            self.records.append((peak - before, current - before, self.source_of(expr)))
+
+    def source_of(self, expr):
+        """The source line of a statement, or the whole input in the REPL. Repeated code has several lines in a file -
+        the first one after the previous statement is picked"""
+        if RUNNING_AS_REPL:
+            return self.source.strip()
+        position = node.position(expr, after=self.position)
+        lines = self.source.splitlines()
+        if position is None or position[0] > len(lines):
+            # e.g. a value, computed at compile time
+            return repr(expr)
+        self.position = position
+        line = lines[position[0] - 1].strip()
+        return f"line {position[0]}: {line}"
+
+    def evaluate(self, expr, scope):
+        if type(expr) == tuple and expr[0] == 'sequence':
+            val = None
+            for item in expr[1]:
+                val = self.measure(item, scope)
+            return val
+        return self.measure(expr, scope)
+
+    def __str__(self):
+        lines = [f"Top {self.top} of {len(self.records)} statements by peak memory:",
+                 f"{'peak':>10} {'net':>10}  statement"]
+        for peak, net, source in sorted(self.records, key=lambda record: record[0], reverse=True)[:self.top]:
+            if len(source) > 80:
+                source = source[:77] + '...'
+            lines.append(f"{format_size(peak):>10} {format_size(net):>10}  {source}")
+        return '\n'.join(lines)
+
+
+def format_size(size: int):
+    for unit in ['B', 'KiB', 'MiB']:
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def is_definition(statement):
+    return type(statement) == tuple and statement[0] == 'def'
+
+
+def optimize(statement):
+    """Optimizes a parsed statement, using the functions defined so far"""
+    if not is_definition(statement):
+        statement = eliminate_common_subexpressions(inline_calls(fold_constants(statement), global_scope), functions)
+        return specialize_operators(statement, type_scope(statement, global_scope), True) if SPECIALIZE else statement
+    _, fun, args, return_type, body = statement
+    # the function can call itself, which doesn't make it impure. If it's already defined, the definition will fail
+    definitions = functions if fun in functions else dict(functions, **{fun: body})
+    # names other than the parameters are looked up in the scope of the caller, their types aren't known
+    arg_scope = TypeScope(types={name: arg_type for arg_type, name in args})
+    body = eliminate_common_subexpressions(inline_calls(fold_constants(body), arg_scope), definitions)
+    if SPECIALIZE:
+        body = specialize_operators(body, type_scope(body, arg_scope), True)
+    return 'def', fun, args, return_type, body
+
+
+def parse(source: str):
+    """Parses source, yielding its optimized top-level statements, reusing the cached ones for a repeated input.
+
+    A statement is optimized only when the previous one is yielded back, so that it can use the functions
+    defined by it. Only inputs without syntax errors or function definitions are cached, and only once
+    all their statements were yielded
+    """
+    statements = parse_cache.get(source)
+    if statements is not None:
+        yield from statements
+        return
+    errors_before = syntax_errors
+    statements = []
+    # nodes of the previous inputs (and their positions) are kept only by the statements using them
+    node.clear()
+    lexer.lineno = 1
+    for statement in yacc.parse(source) or []:
+        statements.append(optimize(statement))
+        yield statements[-1]
+    if syntax_errors == errors_before and not any(is_definition(statement) for statement in statements):
+        parse_cache.put(source, statements)
+
+
+def run(source: str):
+    if memory_report is not None:
+        memory_report.source = source
+    for statement in parse(source):
+        execute(statement)
+
+
+def statement_dependencies(statement, definitions):
+    """Names read and written by a top-level statement, as ('var', name) and ('fun', name) pairs.
+
+    Reads include the functions called and, transitively, the names read by their bodies in definitions.
+    Writes are the assignments and declarations outside of blocks - the only ones reaching the global scope
+    """
+    reads, writes = set(), set()
+    if is_definition(statement):
+        writes.add(('fun', statement[1]))
+    else:
+        add_dependencies(statement, definitions, reads, writes, set())
+    return reads, writes
+
+
+def add_dependencies(expr, definitions, reads, writes, visited_functions):
+    if type(expr) == list:
+        for item in expr:
+            add_dependencies(item, definitions, reads, writes, visited_functions)
+        return
+    if type(expr) != tuple:
+        return
+    if expr[0] == 'name':
+        reads.add(('var', expr[1]))
+    elif expr[0] in ['assign', 'declare']:
+        name = expr[1] if expr[0] == 'assign' else expr[2]
+        # the type of an assigned name comes from its declaration
+        if expr[0] == 'assign':
+            reads.add(('var', name))
+        if writes is not None:
+            writes.add(('var', name))
+    elif expr[0] == 'block':
+        writes = None
+    elif expr[0] == 'call':
+        _, fun, args = expr
+        called = [fun]
+        if fun in parallel_reductions and args and type(args[0]) == tuple and args[0][0] == 'name':
+            called.append(args[0][1])
+        for fun in called:
+            reads.add(('fun', fun))
+            if fun in definitions and fun not in visited_functions:
+                visited_functions.add(fun)
+                add_dependencies(definitions[fun], definitions, reads, None, visited_functions)
+    for child in expr[1:]:
+        add_dependencies(child, definitions, reads, writes, visited_functions)
+
+
+class WatchedProgram:
+    """A program file, executed again whenever it's modified (--watch).
+
+    Top-level statements, including the expressions of top-level sequences, are matched with the ones of the
+    previous run. A statement is executed again if it's new or changed, reads input, or reads or writes a name
+    or function written by a statement executed again or removed. The others reuse the global variables they wrote
+    and the values they printed in the previous run
+    """
+
+    def __init__(self, file_name):
+        self.file_name = file_name
+        self.modified = None
+        # (source, writes, {name: (type, value)} written, printed lines) of each statement of the previous run
+        self.records = []
+
+    def changed(self):
         try:
-            s = input('REPLang > ')
-        except (EOFError, KeyboardInterrupt):
-            break
-        if not s:
-            continue
+            modified = os.stat(self.file_name).st_mtime_ns
+        except OSError:
+            # editors can replace the file when saving it
+            return False
+        if modified == self.modified:
+            return False
+        self.modified = modified
+        return True
+
+    def run(self):
+        """Runs the program, returns the number of statements executed and the number of all statements"""
+        errors_before = syntax_errors
+        # positions of the previous version of the program would only be confusing
+        node.clear()
+        lexer.lineno = 1
+        with open(self.file_name, 'r') as f:
+            statements = [item for statement in yacc.parse(f.read()) or [] for item in sequence_items(statement)]
+        if syntax_errors != errors_before:
+            raise SyntaxError(f"{self.file_name} not executed")
+        sources = [repr(statement) for statement in statements]
+        matcher = difflib.SequenceMatcher(None, [record[0] for record in self.records], sources, autojunk=False)
+        matches = {}
+        for old, new, size in matcher.get_matching_blocks():
+            for i in range(size):
+                matches[new + i] = old + i
+        # names and functions which might have different values than in the previous run
+        changed = set()
+        for i in set(range(len(self.records))) - set(matches.values()):
+            changed |= self.records[i][1]
+        definitions = {statement[1]: statement[4] for statement in statements if is_definition(statement)}
+
+        self.reset()
+        previous_records, self.records = self.records, []
+        executed = 0
+        for i, (statement, source) in enumerate(zip(statements, sources)):
+            reads, writes = statement_dependencies(statement, definitions)
+            if i in matches and not (reads | writes) & changed and not any(('fun', fun) in reads for fun in input_builtins):
+                record = previous_records[matches[i]]
+                self.replay(statement, record)
+            else:
+                changed |= writes
+                record = self.execute(statement, source, writes)
+                executed += 1
+            self.records.append(record)
+        return executed, len(statements)
+
+    @staticmethod
+    def reset():
+        global_scope.types.clear()
+        global_scope.values.clear()
+        for definitions in [functions, function_types, arguments, function_scopes]:
+            definitions.clear()
+        parse_cache.clear()
+        # input files are read from the beginning again, the standard input can't be
+        for name, reader in input_readers.items():
+            if reader.stream is not sys.stdin:
+                reader.stream.close()
+                input_readers[name] = InputReader(open(reader.stream.name, 'r'))
+
+    @staticmethod
+    def execute(statement, source, writes):
+        output.captured = printed = []
         try:
-            yacc.parse(s)
+            if is_definition(statement):
+                define_function(optimize(statement))
+            else:
+                evaluate(optimize(statement), global_scope)
+        finally:
+            output.captured = None
+        effects = {name: (global_scope.types[name], global_scope.values[name])
+                   for kind, name in writes if kind == 'var' and name in global_scope.types}
+        return source, writes, effects, printed
+
+    @staticmethod
+    def replay(statement, record):
+        _, _, effects, printed = record
+        if is_definition(statement):
+            define_function(optimize(statement))
+        for name, (type_class, value) in effects.items():
+            global_scope.types[name] = type_class
+            global_scope.values[name] = value
+        for line in printed:
+            output.write(line)
+
+    def watch(self, interval=0.2):
+        while True:
+            if self.changed():
+                start = time.perf_counter()
+                try:
+                    executed, total = self.run()
+                    output.flush()
+                    print(f"-- {self.file_name}: executed {executed} of {total} statements "
+                          f"in {format_time(time.perf_counter() - start)}", file=sys.stderr)
+                except Exception as e:
+                    print_error(e)
+            time.sleep(interval)
+
+
+def evaluated_nodes(frame):
+    """The nodes evaluated in frame and the frames it was called from, outermost first"""
+    nodes = []
+    while frame is not None:
+        if frame.f_code is evaluate.__code__:
+            nodes.append(frame.f_locals['expression'])
+        frame = frame.f_back
+    nodes.reverse()
+    return nodes
+
+
+def locate_stack(nodes):
+    """Returns the REPLang call stack of nodes being evaluated (outermost first), as [function, line] frames.
+
+    The first frame is the top level (function None), and a frame is added for each call of a defined function
+    once its body is evaluated. The line of a frame is the one of the innermost node with a known position,
+    or None if there is none
+    """
+    stack = [[None, None]]
+    near = None
+    called = None
+    for expr in nodes:
+        if called is not None and expr is functions.get(called):
+            stack.append([called, None])
+            # the body of the function is somewhere else
+            near = None
+        position = node.position(expr, near)
+        if position is not None:
+            near = position
+            stack[-1][1] = position[0]
+        called = expr[1] if type(expr) == tuple and expr[0] == 'call' else None
+    return stack
+
+
+def print_error(error):
+    """Prints an error, with the line of the program it was raised at, if known"""
+    output.flush()
+    nodes = []
+    traceback = error.__traceback__
+    while traceback is not None:
+        if traceback.tb_frame.f_code is evaluate.__code__:
+            nodes.append(traceback.tb_frame.f_locals['expression'])
+        traceback = traceback.tb_next
+    line = locate_stack(nodes)[-1][1]
+    if line is None:
+        print(type(error), error)
+    else:
+        print(type(error), error, f"(line {line})")
+
+
+class Profiler:
+    """Sampling profiler of a program (--profile), run in a separate thread.
+
+    Every interval seconds, the node evaluated by the profiled thread is found in its frames of evaluate(),
+    so evaluation itself isn't slowed down - only the sampling thread takes some of the time
+    """
+
+    def __init__(self, interval=0.01):
+        self.interval = interval
+        self.thread_id = threading.get_ident()
+        # REPLang call stacks, as tuples of (function, line) frames -> number of samples
+        self.stacks = Counter()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.sample, daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+
+    def sample(self):
+        while not self.stopped.wait(self.interval):
+            nodes = evaluated_nodes(sys._current_frames().get(self.thread_id))
+            if nodes:
+                self.stacks[tuple(tuple(frame) for frame in locate_stack(nodes))] += 1
+
+    def report(self, source: str, top=10):
+        """The lines of source where the most samples were taken"""
+        samples = sum(self.stacks.values())
+        lines = Counter()
+        for stack, count in self.stacks.items():
+            lines[stack[-1][1]] += count
+        source_lines = source.split('\n')
+        report = [f"{samples} samples, every {format_time(self.interval)}",
+                  f"{'samples':>8} {'%':>6} {'line':>5}  source"]
+        for line, count in lines.most_common(top):
+            text = source_lines[line - 1].strip() if line is not None and line <= len(source_lines) else '?'
+            report.append(f"{count:>8} {count / samples:>6.1%} {line if line is not None else '?':>5}  {text[:60]}")
+        return '\n'.join(report)
+
+    def collapsed_stacks(self, program: str):
+        """The samples in the collapsed stack format of flamegraph.pl, one stack per line, e.g.
+        'program.repl:12;factorial:2;factorial:5 3'"""
+        return '\n'.join(';'.join(f"{fun or program}:{line}" if line is not None else fun or program
+                                   for fun, line in stack) + f" {count}"
+                          for stack, count in self.stacks.items()) + '\n'
+
+
+def command_cache(arg):
+    print(parse_cache)
+
+
+def command_nodes(arg):
+    print(node)
+
+
+def command_mem(arg):
+    if memory_report is None:
+        raise RuntimeError("Memory accounting is disabled, run with --mem-report to enable it")
+    print(memory_report)
+
+
+def format_time(seconds: float):
+    for unit, scale in [('s', 1), ('ms', 1e-3), ('us', 1e-6)]:
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def command_timeit(arg):
+    """:timeit [-n N] expression - evaluates the expression N times per run (auto-calibrated by default)"""
+    number = None
+    if arg.startswith('-n'):
+        number, _, arg = arg[2:].strip().partition(' ')
+        number = int(number)
+    # parsed as a timeit expression, so that it isn't evaluated at compile time
+    statements = list(parse(f"timeit ({arg})"))
+    if len(statements) != 1:
+        raise ValueError("Expected a single expression to time")
+    number, times = time_expression(statements[0][1], global_scope, number)
+    print(f"{number} loops, {len(times)} runs: min {format_time(min(times))}, "
+          f"median {format_time(statistics.median(times))}, "
+          f"stdev {format_time(statistics.stdev(times))} per loop")
+
+
+repl_commands = {
+    ':cache': command_cache,
+    ':mem': command_mem,
+    ':nodes': command_nodes,
+    ':timeit': command_timeit,
+}
+
+
+def run_command(s: str):
+    name, _, arg = s.strip().partition(' ')
+    if name not in repl_commands:
+        raise NameError(f"Unknown command {name}, available commands: {', '.join(repl_commands)}")
+    repl_commands[name](arg.strip())
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description='REPLang interpreter, runs the REPL if no file is given')
+    arg_parser.add_argument('file', nargs='?', help='program to execute')
+    arg_parser.add_argument('--input', metavar='FILE',
+                            help='file read by readint(), readfloat(), readline() and eof() (standard input by default)')
+    arg_parser.add_argument('--mem-report', action='store_true',
+                            help='report the statements allocating the most memory')
+    arg_parser.add_argument('--fold-budget', type=int, default=FOLD_BUDGET, metavar='N',
+                            help='maximum number of Python calls evaluating a function call at compile time '
+                                 f'(0 disables it, {FOLD_BUDGET} by default)')
+    arg_parser.add_argument('--inline-size', type=int, default=INLINE_SIZE, metavar='N',
+                            help='maximum number of nodes in the body of a function inlined at its calls '
+                                 f'(0 disables inlining, {INLINE_SIZE} by default)')
+    arg_parser.add_argument('--no-specialize', action='store_true',
+                            help="don't replace arithmetic and comparisons of known types with typed operations")
+    arg_parser.add_argument('--unbuffered', action='store_true',
+                            help='write every printed value immediately (by default, only when writing to a terminal)')
+    arg_parser.add_argument('--watch', action='store_true',
+                            help='execute the file again whenever it changes, only the statements affected')
+    arg_parser.add_argument('--profile', action='store_true',
+                            help='report the lines of the file taking the most time, by sampling every 10 ms')
+    arg_parser.add_argument('--profile-output', metavar='FILE',
+                            help='profile the program too, writing the samples to FILE as collapsed stacks '
+                                 '(for flamegraph.pl)')
+    args = arg_parser.parse_args()
+    if args.watch and not args.file:
+        arg_parser.error('--watch requires a file')
+    if (args.profile or args.profile_output) and (not args.file or args.watch):
+        arg_parser.error('--profile and --profile-output require a file, without --watch')
+
+    FOLD_BUDGET = args.fold_budget
+    INLINE_SIZE = args.inline_size
+    SPECIALIZE = not args.no_specialize
+    if args.input:
+        input_readers[None] = InputReader(open(args.input, 'r'))
+    if args.unbuffered or sys.stdout.isatty():
+        output.buffer_size = 0
+
+    if args.mem_report:
+        memory_report = MemoryReport()
+
+    if args.watch:
+        RUNNING_AS_REPL = False
+        try:
+            WatchedProgram(args.file).watch()
+        except KeyboardInterrupt:
+            pass
+    elif args.file:
+        RUNNING_AS_REPL = False
+        with open(args.file, 'r') as f:
+            source = f.read()
+        profiler = Profiler() if args.profile or args.profile_output else None
+        if profiler is not None:
+            profiler.start()
+        try:
+            run(source)
         except Exception as e:
-            print(type(e), e)
+            print_error(e)
+        if profiler is not None:
+            profiler.stop()
+            output.flush()
+            if args.profile:
+                print(profiler.report(source), file=sys.stderr)
+            if args.profile_output:
+                with open(args.profile_output, 'w') as f:
+                    f.write(profiler.collapsed_stacks(os.path.basename(args.file)))
+    else:
+        while True:
+            output.flush()
+            try:
+                s = input('REPLang > ')
+            except (EOFError, KeyboardInterrupt):
+                break
+            if not s:
+                continue
+            try:
+                if s.startswith(':'):
+                    run_command(s)
+                else:
+                    run(s)
+            except Exception as e:
+                output.flush()
+                print(type(e), e)
+
+    output.flush()
+    if memory_report is not None:
+        print(memory_report)
@@ -1,6 +1,13 @@
-tokens = (
-    'NAME', 'FLOAT', 'NUMBER', 'EQ', 'NEQ'
-)
+import argparse
+import operator
+import re
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 literals = ['=', '+', '-', '*', '/', '(', ')', '^', '>', '<', ';']
 
@@ -9,145 +16,212 @@ literals = ['=', '+', '-', '*', '/', '(', ')', '^', '>', '<', ';']
 t_NAME = r'[a-zA-Z_][a-zA-Z0-9_]*'
 t_EQ = r'=='
 t_NEQ = r'!='
-
-
-def t_FLOAT(t):
-    r'(\d+\.\d*)|(\.\d+)'
-    t.value = float(t.value)
-    return t
-
-
-def t_NUMBER(t):
-    r'\d+'
-    t.value = int(t.value)
-    return t
-
-
-t_ignore = " \t"
-
-
-def t_newline(t):
-    r'\n+'
-    t.lexer.lineno += t.value.count("\n")
-
-
-def t_error(t):
-    print("Illegal character '%s'" % t.value[0])
-    t.lexer.skip(1)
-
-
-# Build the lexer
-import ply.lex as lex
-
-lexer = lex.lex()
-
-# Parsing rules
-
-precedence = (
-    ('left', '+', '-'),
-    ('left', '*', '/'),
-    ('right', '^'),
-    ('right', 'UMINUS'),
-)
-
-# dictionary of names
+t_FLOAT = r'\d+\.\d*|\.\d+'
+t_NUMBER = r'\d+'
+
+# Build the lexer - one regular expression trying the rules in order, whitespace is ignored.
+# Anything else (literals and illegal characters) is matched one character at a time.
+# It has no capturing groups, so findall returns the lexemes themselves
+lexer = re.compile('|'.join([t_FLOAT, t_NUMBER, t_NAME, t_EQ, t_NEQ, r'\S']))
+
+# Evaluation
+
+binary_ops = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '^': operator.pow,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '>': operator.gt,
+    '<': operator.lt,
+}
+
+# dictionary of names, holding numbers or whole NumPy columns
 names = {}
 
 
-def p_statement_assign(p):
-    'statement : NAME "=" expression'
-    names[p[1]] = p[3]
-
-def p_error_expression(p):
-    "expression : error ';' expression"
-    p[0] = p[3]
-
-def p_expression_semicolon(p):
-    "expression : expression ';' expression"
-    if type(p[3]) == list:
-        p[0] = [p[1]] + p[3]
-    else:
-        p[0] = [p[1], p[3]]
-
-
-def p_statement_expr(p):
-    'statement : expression'
-    print(p[1])
-
-
-def p_expression_binop(p):
-    '''expression : expression expression '+'
-                  | expression expression '-'
-                  | expression expression '*'
-                  | expression expression '/'
-                  | expression expression '^'
-                  | expression expression EQ
-                  | expression expression '>'
-                  | expression expression '<'
-                  | expression expression NEQ'''
-    if p[3] == '+':
-        p[0] = p[1] + p[2]
-    elif p[3] == '-':
-        p[0] = p[1] - p[2]
-    elif p[3] == '*':
-        p[0] = p[1] * p[2]
-    elif p[3] == '/':
-        p[0] = p[1] / p[2]
-    elif p[3] == '^':
-        p[0] = p[1] ** p[2]
-    elif p[3] == '^':
-        p[0] = p[1] ** p[2]
-    elif p[3] == '==':
-        p[0] = p[1] == p[2]
-    elif p[3] == '!=':
-        p[0] = p[1] != p[2]
-    elif p[3] == '>':
-        p[0] = p[1] > p[2]
-    elif p[3] == '<':
-        p[0] = p[1] < p[2]
-
-
-def p_expression_uminus(p):
-    "expression : '-' expression %prec UMINUS"
-    p[0] = -p[2]
-
-
-def p_expression_group(p):
-    "expression : '(' expression ')'"
-    p[0] = p[2]
-
-
-def p_expression_number(p):
-    """expression : NUMBER
-                    | FLOAT"""
-    p[0] = p[1]
-
-
-def p_expression_name(p):
-    "expression : NAME"
+def evaluate(lexemes):
+    """Evaluates a list of lexemes with an operand stack, in a single pass.
+    Operators work element-wise on names bound to columns by ':load'.
+
+    '-' with at least two operands on the stack (since the last '(') is subtraction,
+    otherwise it negates the next operand, e.g. '5 -3 +' == 2
+    """
+    stack = []
+    # each open '(' remembers where its operands start and whether it is negated
+    groups = []
+    group_start = 0
+    negate = False
+    for lexeme in lexemes:
+        op = binary_ops.get(lexeme)
+        if op is not None and (lexeme != '-' or len(stack) - group_start >= 2):
+            if len(stack) - group_start < 2:
+                raise SyntaxError("Syntax error at '%s'" % lexeme)
+            val2 = stack.pop()
+            stack[-1] = op(stack[-1], val2)
+            continue
+        first = lexeme[0]
+        if first.isdigit() or (first == '.' and len(lexeme) > 1):
+            value = float(lexeme) if '.' in lexeme else int(lexeme)
+        elif first.isalpha() or first == '_':
+            try:
+                value = names[lexeme]
+            except LookupError:
+                print("Undefined name '%s'" % lexeme, file=sys.stderr)
+                value = 0
+        elif lexeme == '-':
+            negate = not negate
+            continue
+        elif lexeme == '(':
+            groups.append((group_start, negate))
+            group_start = len(stack)
+            negate = False
+            continue
+        elif lexeme == ')':
+            if not groups or len(stack) - group_start != 1:
+                raise SyntaxError("Syntax error at ')'")
+            group_start, negate = groups.pop()
+            if negate:
+                stack[-1] = -stack[-1]
+                negate = False
+            continue
+        elif lexeme in literals:
+            raise SyntaxError("Syntax error at '%s'" % lexeme)
+        else:
+            print("Illegal character '%s'" % lexeme, file=sys.stderr)
+            continue
+        stack.append(-value if negate else value)
+        negate = False
+    if groups or negate or len(stack) != 1:
+        raise SyntaxError("Syntax error at EOF")
+    return stack[0]
+
+
+def load_column(name, file_name, column=None):
+    """Reads a numeric column from a .npy or a CSV file.
+
+    CSV files can have a header row, in which case the column can be selected by its name.
+    By default, the column with the same name as the one it's loaded as is selected, or the first one
+    """
+    if file_name.endswith('.npy'):
+        return np.load(file_name).ravel()
+    with open(file_name, 'r') as f:
+        header = f.readline().strip().split(',')
     try:
-        p[0] = names[p[1]]
-    except LookupError:
-        print("Undefined name '%s'" % p[1])
-        p[0] = 0
-
-
-def p_error(p):
-    if p:
-        print("Syntax error at '%s'" % p.value)
+        [float(cell) for cell in header]
+        header, skip_rows = [], 0
+    except ValueError:
+        header, skip_rows = [cell.strip() for cell in header], 1
+    if column is None:
+        column = name if name in header else 0
+    if column in header:
+        column = header.index(column)
+    data = np.loadtxt(file_name, delimiter=',', skiprows=skip_rows, ndmin=2)
+    return data[:, int(column)]
+
+
+def save_column(name, file_name):
+    value = names[name]
+    if file_name.endswith('.npy'):
+        np.save(file_name, np.asarray(value))
     else:
-        print("Syntax error at EOF")
+        np.savetxt(file_name, np.atleast_1d(value), delimiter=',', header=name, comments='', fmt='%.17g')
 
 
-import ply.yacc as yacc
-
-parser = yacc.yacc()
-
-while True:
+def run_command(args):
+    """Runs a ':' command - ':load NAME FILE [COLUMN]' or ':save NAME FILE'"""
+    if np is None:
+        print("NumPy is required for %s" % args[0], file=sys.stderr)
+        return
     try:
-        s = input('calc > ')
-    except (EOFError, KeyboardInterrupt):
-        break
-    if not s:
-        continue
-    yacc.parse(s)
+        if args[0] == ':load' and len(args) in (3, 4):
+            names[args[1]] = load_column(*args[1:])
+        elif args[0] == ':save' and len(args) == 3:
+            save_column(*args[1:])
+        else:
+            print("Unknown command '%s'" % ' '.join(args), file=sys.stderr)
+    except LookupError as e:
+        print("Undefined name or column %s" % e, file=sys.stderr)
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)
+
+
+def run_line(s):
+    """Runs one line of input - either 'NAME = expression', a ':' command, or expressions separated by ';'
+
+    Returns the value (a list of values for ';'-separated expressions), or None for an assignment or a command
+    """
+    if s.lstrip().startswith(':'):
+        return run_command(s.split())
+    lexemes = lexer.findall(s)
+    if len(lexemes) > 1 and lexemes[1] == '=' and (lexemes[0][0].isalpha() or lexemes[0][0] == '_'):
+        names[lexemes[0]] = evaluate(lexemes[2:])
+        return None
+    if ';' not in lexemes:
+        return evaluate(lexemes)
+    results = []
+    for expression in ' '.join(lexemes).split(';'):
+        try:
+            results.append(evaluate(expression.split()))
+        except (SyntaxError, ArithmeticError, TypeError, ValueError) as e:
+            print(e, file=sys.stderr)
+    return results
+
+
+def run_batch(in_file, out_file, chunk_size=4096):
+    """Evaluates newline-separated expressions from in_file, writing one result per line to out_file
+
+    Results are written in chunks of chunk_size lines. Warnings, e.g. about undefined names, go to stderr,
+    so that out_file has exactly one line per result. Returns the number of evaluated lines
+    """
+    count = 0
+    chunk = []
+    for line in in_file:
+        if not line.strip():
+            continue
+        count += 1
+        try:
+            val = run_line(line)
+        except (SyntaxError, ArithmeticError, TypeError, ValueError) as e:
+            val = e
+        if val is not None:
+            chunk.append(f'{val}\n')
+        if len(chunk) >= chunk_size:
+            out_file.write(''.join(chunk))
+            chunk.clear()
+    out_file.write(''.join(chunk))
+    out_file.flush()
+    return count
+
+
+arg_parser = argparse.ArgumentParser(description='Reverse Polish Notation calculator')
+arg_parser.add_argument('--batch', nargs='?', const='-', metavar='FILE',
+                        help='evaluate expressions line by line from FILE (stdin by default)')
+args = arg_parser.parse_args()
+
+if args.batch:
+    start = time.perf_counter()
+    if args.batch == '-':
+        n = run_batch(sys.stdin, sys.stdout)
+    else:
+        with open(args.batch, 'r') as f:
+            n = run_batch(f, sys.stdout)
+    elapsed = time.perf_counter() - start
+    print(f'{n} expressions in {elapsed:.3f} s ({n / elapsed if elapsed else 0:.0f} expr/s)', file=sys.stderr)
+else:
+    while True:
+        try:
+            s = input('calc > ')
+        except (EOFError, KeyboardInterrupt):
+            break
+        if not s:
+            continue
+        try:
+            val = run_line(s)
+        except (SyntaxError, ArithmeticError, TypeError, ValueError) as e:
+            print(e)
+            continue
+        if val is not None:
+            print(val)